@@ -3,94 +3,167 @@
 # Spring 2026
 # County Project - Monolith for Sprint 1
 
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date as Date, datetime
+from functools import lru_cache
+import hashlib
+from html import escape
 import json
+import math
 from pathlib import Path
-from typing import Dict, List, Optional
-
-
-# Canonical full names for display
-USPS_CODE_TO_STATE_NAME: Dict[str, str] = {
-    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
-    "CA": "California", "CO": "Colorado", "CT": "Connecticut",
-    "DE": "Delaware", "FL": "Florida", "GA": "Georgia", "HI": "Hawaii",
-    "ID": "Idaho", "IL": "Illinois", "IN": "Indiana", "IA": "Iowa",
-    "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine",
-    "MD": "Maryland", "MA": "Massachusetts", "MI": "Michigan",
-    "MN": "Minnesota", "MS": "Mississippi", "MO": "Missouri", "MT": "Montana",
-    "NE": "Nebraska", "NV": "Nevada", "NH": "New Hampshire",
-    "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
-    "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio",
-    "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania",
-    "RI": "Rhode Island", "SC": "South Carolina", "SD": "South Dakota",
-    "TN": "Tennessee", "TX": "Texas", "UT": "Utah", "VT": "Vermont",
-    "VA": "Virginia", "WA": "Washington", "WV": "West Virginia",
-    "WI": "Wisconsin", "WY": "Wyoming", "DC": "District of Columbia",
-}
-
-STATE_TOTALS: Dict[str, int] = {
-    "AL": 67, "AK": 29, "AZ": 15, "AR": 75, "CA": 58, "CO": 64, "CT": 8,
-    "DE": 3, "FL": 67, "GA": 159, "HI": 5, "ID": 44, "IL": 102, "IN": 92,
-    "IA": 99, "KS": 105, "KY": 120, "LA": 64, "ME": 16, "MD": 24, "MA": 14,
-    "MI": 83, "MN": 87, "MS": 82, "MO": 115, "MT": 56, "NE": 93, "NV": 17,
-    "NH": 10, "NJ": 21, "NM": 33, "NY": 62, "NC": 100, "ND": 53, "OH": 88,
-    "OK": 77, "OR": 36, "PA": 67, "RI": 5, "SC": 46, "SD": 66, "TN": 95,
-    "TX": 254, "UT": 29, "VT": 14, "VA": 133, "WA": 39, "WV": 55,
-    "WI": 72, "WY": 23, "DC": 1,
-}
-
-USA_TOTAL = sum(STATE_TOTALS.values())  # expected 3,143 (50 states + DC)
-
-
-STATE_NAME_TO_CODE: Dict[str, str] = {
-    # 2-letter codes (map to themselves)
-    "AL": "AL", "AK": "AK", "AZ": "AZ", "AR": "AR", "CA": "CA",
-    "CO": "CO", "CT": "CT", "DE": "DE", "FL": "FL", "GA": "GA",
-    "HI": "HI", "ID": "ID", "IL": "IL", "IN": "IN", "IA": "IA",
-    "KS": "KS", "KY": "KY", "LA": "LA", "ME": "ME", "MD": "MD",
-    "MA": "MA", "MI": "MI", "MN": "MN", "MS": "MS", "MO": "MO",
-    "MT": "MT", "NE": "NE", "NV": "NV", "NH": "NH", "NJ": "NJ",
-    "NM": "NM", "NY": "NY", "NC": "NC", "ND": "ND", "OH": "OH",
-    "OK": "OK", "OR": "OR", "PA": "PA", "RI": "RI", "SC": "SC",
-    "SD": "SD", "TN": "TN", "TX": "TX", "UT": "UT", "VT": "VT",
-    "VA": "VA", "WA": "WA", "WV": "WV", "WI": "WI", "WY": "WY",
-    "DC": "DC",
-
-    # Full names to 2-letter codes
-    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR",
-    "CALIFORNIA": "CA", "COLORADO": "CO", "CONNECTICUT": "CT",
-    "DELAWARE": "DE", "FLORIDA": "FL", "GEORGIA": "GA", "HAWAII": "HI",
-    "IDAHO": "ID", "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA",
-    "KANSAS": "KS", "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME",
-    "MARYLAND": "MD", "MASSACHUSETTS": "MA", "MICHIGAN": "MI",
-    "MINNESOTA": "MN", "MISSISSIPPI": "MS", "MISSOURI": "MO", "MONTANA": "MT",
-    "NEBRASKA": "NE", "NEVADA": "NV", "NEW HAMPSHIRE": "NH",
-    "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY",
-    "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH",
-    "OKLAHOMA": "OK", "OREGON": "OR", "PENNSYLVANIA": "PA",
-    "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC", "SOUTH DAKOTA": "SD",
-    "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT", "VERMONT": "VT",
-    "VIRGINIA": "VA", "WASHINGTON": "WA", "WEST VIRGINIA": "WV",
-    "WISCONSIN": "WI", "WYOMING": "WY", "DISTRICT OF COLUMBIA": "DC",
-    "WASHINGTON DC": "DC", "WASHINGTON, DC": "DC", "D.C.": "DC", "DC.": "DC",
-}
+import re
+from types import MappingProxyType
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# One row per state: (USPS code, full name, number of counties).
+# Every lookup table below is generated from this list. County counts
+# follow the 2020 Census (3,143 counties and equivalents).
+_STATE_DATA: Tuple[Tuple[str, str, int], ...] = (
+    ("AL", "Alabama", 67),
+    ("AK", "Alaska", 30),
+    ("AZ", "Arizona", 15),
+    ("AR", "Arkansas", 75),
+    ("CA", "California", 58),
+    ("CO", "Colorado", 64),
+    ("CT", "Connecticut", 8),
+    ("DE", "Delaware", 3),
+    ("FL", "Florida", 67),
+    ("GA", "Georgia", 159),
+    ("HI", "Hawaii", 5),
+    ("ID", "Idaho", 44),
+    ("IL", "Illinois", 102),
+    ("IN", "Indiana", 92),
+    ("IA", "Iowa", 99),
+    ("KS", "Kansas", 105),
+    ("KY", "Kentucky", 120),
+    ("LA", "Louisiana", 64),
+    ("ME", "Maine", 16),
+    ("MD", "Maryland", 24),
+    ("MA", "Massachusetts", 14),
+    ("MI", "Michigan", 83),
+    ("MN", "Minnesota", 87),
+    ("MS", "Mississippi", 82),
+    ("MO", "Missouri", 115),
+    ("MT", "Montana", 56),
+    ("NE", "Nebraska", 93),
+    ("NV", "Nevada", 17),
+    ("NH", "New Hampshire", 10),
+    ("NJ", "New Jersey", 21),
+    ("NM", "New Mexico", 33),
+    ("NY", "New York", 62),
+    ("NC", "North Carolina", 100),
+    ("ND", "North Dakota", 53),
+    ("OH", "Ohio", 88),
+    ("OK", "Oklahoma", 77),
+    ("OR", "Oregon", 36),
+    ("PA", "Pennsylvania", 67),
+    ("RI", "Rhode Island", 5),
+    ("SC", "South Carolina", 46),
+    ("SD", "South Dakota", 66),
+    ("TN", "Tennessee", 95),
+    ("TX", "Texas", 254),
+    ("UT", "Utah", 29),
+    ("VT", "Vermont", 14),
+    ("VA", "Virginia", 133),
+    ("WA", "Washington", 39),
+    ("WV", "West Virginia", 55),
+    ("WI", "Wisconsin", 72),
+    ("WY", "Wyoming", 23),
+    ("DC", "District of Columbia", 1),
+)
+
+_EXPECTED_USA_TOTAL = 3143
+
+# Extra spellings that should map to a state code
+_STATE_ALIASES: Tuple[Tuple[str, str], ...] = (
+    ("WASHINGTON DC", "DC"), ("WASHINGTON, DC", "DC"),
+    ("WASHINGTON, D.C.", "DC"), ("D.C.", "DC"), ("DC.", "DC"),
+)
+
+
+def _clean_state_text(s: str) -> str:
+    """Drop periods/commas, collapse spaces and upper-case a state name."""
+    return " ".join(s.replace(".", " ").replace(",", " ").split()).upper()
+
+
+def _build_state_tables():
+    """Build the frozen state lookup tables and check they agree."""
+    names: Dict[str, str] = {}
+    totals: Dict[str, int] = {}
+    to_code: Dict[str, str] = {}
+
+    for code, name, total in _STATE_DATA:
+        if code in names:
+            raise RuntimeError(f"State code {code!r} is listed twice.")
+        if _clean_state_text(name) in to_code:
+            raise RuntimeError(f"State name {name!r} is listed twice.")
+        if len(code) != 2 or not code.isalpha() or not code.isupper():
+            raise RuntimeError(f"State code {code!r} is not valid.")
+        if total <= 0:
+            raise RuntimeError(f"State {code!r} has no counties.")
+        names[code] = name
+        totals[code] = total
+        to_code[code] = code
+        to_code[_clean_state_text(name)] = code
+
+    for alias, code in _STATE_ALIASES:
+        if code not in names:
+            raise RuntimeError(f"Alias {alias!r} points to unknown {code!r}.")
+        # Keep the alias as written as well as its cleaned form, so
+        # code indexing the table directly still finds "D.C." and such
+        for key in (alias, _clean_state_text(alias)):
+            if to_code.get(key, code) != code:
+                raise RuntimeError(f"Alias {alias!r} clashes with a state.")
+            to_code[key] = code
+
+    if sum(totals.values()) != _EXPECTED_USA_TOTAL:
+        raise RuntimeError(
+            f"State county totals add up to {sum(totals.values())}, "
+            f"not {_EXPECTED_USA_TOTAL}."
+        )
+
+    # Exact spellings people usually type, checked before any cleanup
+    exact: Dict[str, str] = {}
+    for key, code in to_code.items():
+        exact[key] = code
+        exact[key.lower()] = code
+        exact[key.title()] = code
+    for code, name in names.items():
+        exact[name] = code
+
+    return (MappingProxyType(names), MappingProxyType(totals),
+            MappingProxyType(to_code), MappingProxyType(exact))
+
+
+(USPS_CODE_TO_STATE_NAME,
+ STATE_TOTALS,
+ STATE_NAME_TO_CODE,
+ _EXACT_STATE_LOOKUP) = _build_state_tables()
+
+USA_TOTAL = sum(STATE_TOTALS.values())  # 3,143 (50 states + DC)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_state_slow(s: str) -> Optional[str]:
+    """Look up a free-form state name after cleaning it up."""
+    return STATE_NAME_TO_CODE.get(_clean_state_text(s))
 
 
 def normalize_state_to_code(s: str) -> str:
     """This function takes a state (two letter code or full name) as input
     and returns the two letter state code as output."""
+    try:
+        return _EXACT_STATE_LOOKUP[s]
+    except (KeyError, TypeError):
+        pass
+
     if not isinstance(s, str):
         raise ValueError("State must be a string.")
 
-    # Normalize spaces and punctuation for matching
-    cleaned = " ".join(s.replace(".", " ").replace(",", " ").split()).upper()
-
-    if len(cleaned) == 2 and cleaned.isalpha():
-        code = STATE_NAME_TO_CODE.get(cleaned)
-        if code:
-            return code
-
-    code = STATE_NAME_TO_CODE.get(cleaned)
+    code = _normalize_state_slow(s)
     if code:
         return code
 
@@ -101,6 +174,23 @@ def normalize_state_to_code(s: str) -> str:
         )
 
 
+def normalize_states(states: Iterable[str]) -> List[str]:
+    """Normalize a whole column of states at once, returning the codes
+    in the same order. Each distinct spelling is only looked up once.
+    Raises ValueError on the first state that is not recognized."""
+    seen: Dict[str, str] = {}
+    codes = []
+    for s in states:
+        try:
+            code = seen[s]
+        except (KeyError, TypeError):
+            code = normalize_state_to_code(s)
+            if isinstance(s, str):
+                seen[s] = code
+        codes.append(code)
+    return codes
+
+
 def normalize_county_display(name: str) -> str:
     """This function takes a county name as input and attempts to
     remove extra spaces and give it a consistent capitalization format.
@@ -118,16 +208,205 @@ def normalize_date_format(date_str: str) -> str:
     return dt.strftime("%m/%d/%y")
 
 
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize_note(text: Optional[str]) -> List[str]:
+    """Split a note into lowercase word tokens for searching."""
+    if not isinstance(text, str):
+        return []
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def visit_key(visit: dict) -> Tuple[str, str]:
+    """Return the (county, state) key used to spot duplicate visits."""
+    return (normalize_county_display(str(visit.get("county", ""))).casefold(),
+            str(visit.get("state", "")).upper())
+
+
+def _hash_state_rows(visits: Iterable[dict]) -> str:
+    """Return an order-independent content hash of one state's visits."""
+    rows = sorted(
+        visit_key(v) + (str(v.get("date", "")), v.get("note") or "")
+        for v in visits
+    )
+    return hashlib.sha256(
+        json.dumps(rows, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def state_hashes_for(visits: Iterable[dict]) -> Dict[str, str]:
+    """Return the content hash of every state found in a list of visits.
+
+    Entries that are not visit records are ignored.
+    """
+    by_state: Dict[str, List[dict]] = {}
+    for v in visits:
+        if isinstance(v, dict):
+            by_state.setdefault(str(v.get("state", "")).upper(),
+                                []).append(v)
+    return {code: _hash_state_rows(rows)
+            for code, rows in sorted(by_state.items())}
+
+
+class VisitIndex:
+    """In-memory indexes over a list of visits.
+
+    - by_state maps a two letter code to record positions.
+    - Dates and county names are kept sorted so ranges and prefixes
+      can be found with a binary search.
+    - by_token is an inverted index over the words in each note.
+    """
+
+    def __init__(self, visits: Iterable[dict]):
+        self.visits: List[dict] = []
+        self.by_state: Dict[str, Set[int]] = {}
+        self.by_token: Dict[str, Set[int]] = {}
+        self._dates: List[Tuple[Date, int]] = []
+        self._counties: List[Tuple[str, int]] = []
+        self.keys: Set[Tuple[str, str]] = set()
+
+        for v in visits:
+            self._insert(v)
+        self._dates.sort()
+        self._counties.sort()
+
+    def _insert(self, visit: dict) -> Optional[int]:
+        """Add one visit to the unsorted indexes and return its position."""
+        if not isinstance(visit, dict):
+            return None
+
+        pos = len(self.visits)
+        self.visits.append(visit)
+
+        state = str(visit.get("state", "")).upper()
+        self.by_state.setdefault(state, set()).add(pos)
+        self.keys.add(visit_key(visit))
+
+        for token in tokenize_note(visit.get("note")):
+            self.by_token.setdefault(token, set()).add(pos)
+
+        try:
+            day = datetime.strptime(str(visit.get("date", "")),
+                                    "%m/%d/%y").date()
+            self._dates.append((day, pos))
+        except ValueError:
+            pass
+
+        county = normalize_county_display(str(visit.get("county", "")))
+        self._counties.append((county.casefold(), pos))
+        return pos
+
+    def add(self, visit: dict) -> None:
+        """Index a newly added visit, keeping the sorted lists sorted."""
+        dates_before = len(self._dates)
+        if self._insert(visit) is None:
+            return
+        # _insert appended to the end; move the new entries into place
+        if len(self._dates) > dates_before:
+            entry = self._dates.pop()
+            self._dates.insert(bisect_left(self._dates, entry), entry)
+        entry = self._counties.pop()
+        self._counties.insert(bisect_left(self._counties, entry), entry)
+
+    def _positions_for_dates(
+        self, start: Optional[Date], end: Optional[Date]
+    ) -> Set[int]:
+        lo = 0 if start is None else bisect_left(self._dates, (start, -1))
+        hi = (len(self._dates) if end is None
+              else bisect_right(self._dates, (end, len(self.visits))))
+        return {pos for _, pos in self._dates[lo:hi]}
+
+    def _positions_for_prefix(self, prefix: str) -> Set[int]:
+        key = normalize_county_display(prefix).casefold()
+        lo = bisect_left(self._counties, (key, -1))
+        found = set()
+        for name, pos in self._counties[lo:]:
+            if not name.startswith(key):
+                break
+            found.add(pos)
+        return found
+
+    def search(
+        self,
+        state: Optional[str] = None,
+        county_prefix: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> List[dict]:
+        """Return visits matching every filter given, in stored order.
+
+        - state may be a two letter code or full name.
+        - date_from and date_to are inclusive MM/DD/YY dates.
+        - text matches notes containing all of its words.
+        """
+        candidates: List[Set[int]] = []
+
+        if state:
+            code = normalize_state_to_code(state)
+            candidates.append(self.by_state.get(code, set()))
+
+        if county_prefix and county_prefix.strip():
+            candidates.append(self._positions_for_prefix(county_prefix))
+
+        if date_from or date_to:
+            start = (datetime.strptime(date_from, "%m/%d/%y").date()
+                     if date_from else None)
+            end = (datetime.strptime(date_to, "%m/%d/%y").date()
+                   if date_to else None)
+            candidates.append(self._positions_for_dates(start, end))
+
+        if text and text.strip():
+            tokens = tokenize_note(text)
+            if not tokens:
+                # Text with no words in it can never match a note
+                return []
+            for token in tokens:
+                candidates.append(self.by_token.get(token, set()))
+
+        if not candidates:
+            return list(self.visits)
+
+        # Intersect starting from the smallest set to keep the work small
+        candidates.sort(key=len)
+        matches = set(candidates[0])
+        for other in candidates[1:]:
+            if not matches:
+                break
+            matches &= other
+
+        return [self.visits[pos] for pos in sorted(matches)]
+
+
 class VisitStore:
     """Store county visits in a JSON file at the given path.
 
     - Accepts state as two letter code or full name, stores as two letter code.
     - County/state duplicates are rejected (case-insensitive county).
     - File is created on first use; corrupted JSON is backed up.
+    - Search indexes are built on first use and rebuilt if the file
+      changes on disk.
+    - Per-state content hashes used by sync_stores are kept in a
+      "<file>.hashes" sidecar, tagged with a hash of the file's bytes.
     """
 
     def __init__(self, path: Path):
         self.path = Path(path)
+        self._index: Optional[VisitIndex] = None
+        self._index_stamp: Optional[Tuple[int, int]] = None
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime, size) of the file, or None if it is missing."""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _index_is_current(self) -> bool:
+        return (self._index is not None
+                and self._index_stamp == self._file_stamp())
 
     def ensure_file(self) -> None:
         """Create the JSON file if it doesn't already exist."""
@@ -150,6 +429,89 @@ class VisitStore:
             self.path.write_text("[]\n", encoding="utf-8")
             return []
 
+    def load_strict(self) -> List[dict]:
+        """Load visits, raising ValueError if the file is missing or is
+        not a JSON list. Unlike load(), the file is never changed."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise ValueError(
+                f"The file {str(self.path)!r} could not be read "
+                f"as a list of visits:\n{exc}\n"
+            ) from exc
+        if not isinstance(data, list):
+            raise ValueError(
+                f"The file {str(self.path)!r} does not hold "
+                "a list of visits.\n"
+            )
+        return data
+
+    def _hash_path(self) -> Path:
+        return self.path.with_suffix(self.path.suffix + ".hashes")
+
+    def _content_stamp(self) -> Optional[str]:
+        """Return a hash of the file's raw bytes, or None if unreadable.
+
+        (mtime, size) is not enough here: copying a file with its
+        modification time kept can give a new file the old stamp.
+        Hashing the bytes is still far cheaper than parsing the rows.
+        """
+        try:
+            return hashlib.sha256(self.path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def _saved_hashes(self) -> Optional[Dict[str, str]]:
+        """Return the sidecar hashes if they match the file on disk."""
+        stamp = self._content_stamp()
+        if stamp is None:
+            return None
+        try:
+            data = json.loads(self._hash_path().read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if (isinstance(data, dict) and data.get("stamp") == stamp
+                and isinstance(data.get("states"), dict)):
+            return data["states"]
+        return None
+
+    def save_hashes(self, hashes: Dict[str, str]) -> None:
+        """Write the per-state hashes for the file as it is right now.
+
+        The sidecar is only a shortcut, so if its folder cannot be
+        written (a read-only share, for example) it is simply skipped.
+        """
+        stamp = self._content_stamp()
+        if stamp is None:
+            return
+        path = self._hash_path()
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        try:
+            tmp.write_text(
+                json.dumps({"stamp": stamp, "states": hashes}, indent=2)
+                + "\n",
+                encoding="utf-8"
+            )
+            tmp.replace(path)
+        except OSError:
+            pass
+
+    def state_hashes(self, strict: bool = False) -> Dict[str, str]:
+        """Return the content hash of each state's visits.
+
+        The sidecar is used when it matches the file's bytes, so the
+        visits are only parsed when they changed outside add_visit.
+        With strict, a bad file raises ValueError (see load_strict)
+        instead of being backed up and reset.
+        """
+        hashes = self._saved_hashes()
+        if hashes is not None:
+            return hashes
+        visits = self.load_strict() if strict else self.load()
+        hashes = state_hashes_for(visits)
+        self.save_hashes(hashes)
+        return hashes
+
     def save(self, visits: List[dict]) -> None:
         """Save list of visits back to the file."""
         tmp = self.path.with_suffix(self.path.suffix + ".tmp")
@@ -171,6 +533,8 @@ class VisitStore:
         note: Optional[str] = None,
     ) -> None:
         """Append a new visit if (county, state) not already present."""
+        index_current = self._index_is_current()
+        hashes = self._saved_hashes()
         visits = self.load()
 
         # Normalize inputs
@@ -196,16 +560,697 @@ class VisitStore:
                 f"in state '{state_code}' already exists.\n"
             )
 
-        visits.append(
-            {
-                "county": county_norm,
-                "state": state_code,
-                "date": date_clean,
-                "note": note_clean,
-            }
-        )
+        visit = {
+            "county": county_norm,
+            "state": state_code,
+            "date": date_clean,
+            "note": note_clean,
+        }
+        visits.append(visit)
         self.save(visits)
 
+        # Keep the sync hashes current if this store has them
+        if hashes is not None:
+            hashes = dict(hashes)
+            hashes[state_code] = _hash_state_rows(
+                v for v in visits
+                if isinstance(v, dict)
+                and str(v.get("state", "")).upper() == state_code
+            )
+            self.save_hashes(dict(sorted(hashes.items())))
+        elif self._hash_path().exists():
+            self.save_hashes(state_hashes_for(visits))
+
+        if index_current:
+            self._index.add(visit)
+            self._index_stamp = self._file_stamp()
+        else:
+            self._index = None
+
+    def index(self) -> VisitIndex:
+        """Return the search index, building it if missing or stale."""
+        if not self._index_is_current():
+            visits = self.load()
+            self._index = VisitIndex(visits)
+            self._index_stamp = self._file_stamp()
+        return self._index
+
+    def search(
+        self,
+        state: Optional[str] = None,
+        county_prefix: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> List[dict]:
+        """Return stored visits matching all of the given filters."""
+        return self.index().search(
+            state=state,
+            county_prefix=county_prefix,
+            date_from=date_from,
+            date_to=date_to,
+            text=text,
+        )
+
+
+_USER_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+class MultiUserStore:
+    """Keep each traveler's visits in their own shard under a root folder.
+
+    - shards/<user_id>.json holds a user's visits (a normal VisitStore).
+    - summaries/<user_id>.json holds per-state counts for that shard so
+      totals across users never have to open the shards themselves.
+    - At most max_open shards are kept open; the least recently used
+      one is dropped when the cap is reached.
+    """
+
+    def __init__(self, root: Path, max_open: int = 64):
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1.")
+        self.root = Path(root)
+        self.max_open = max_open
+        self.shard_dir = self.root / "shards"
+        self.summary_dir = self.root / "summaries"
+        self._open: "OrderedDict[str, VisitStore]" = OrderedDict()
+
+    def _check_user_id(self, user_id: str) -> str:
+        """Reject ids that could escape the shard folder and return the
+        id in lower case. Filenames are not case-sensitive on every
+        system, so "Alice" and "alice" must be the same user."""
+        if not isinstance(user_id, str) or not _USER_ID_RE.fullmatch(user_id):
+            raise ValueError(
+                f"The user id: {user_id!r} is not valid. "
+                "\nUse 1-64 letters, digits, '-' or '_'.\n"
+            )
+        return user_id.lower()
+
+    def _summary_path(self, user_id: str) -> Path:
+        return self.summary_dir / f"{user_id}.json"
+
+    def store_for(self, user_id: str) -> VisitStore:
+        """Return the open store for a user, opening it if needed."""
+        user_id = self._check_user_id(user_id)
+
+        shard = self._open.get(user_id)
+        if shard is not None:
+            self._open.move_to_end(user_id)
+            return shard
+
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        shard = VisitStore(self.shard_dir / f"{user_id}.json")
+        shard.ensure_file()
+        self._open[user_id] = shard
+        if len(self._open) > self.max_open:
+            self._open.popitem(last=False)
+        return shard
+
+    def open_users(self) -> List[str]:
+        """Return the users whose shards are currently open."""
+        return list(self._open)
+
+    def user_ids(self) -> List[str]:
+        """Return every user that has a shard on disk.
+
+        Files whose names are not valid user ids are ignored.
+        """
+        if not self.shard_dir.exists():
+            return []
+        return sorted(
+            p.stem for p in self.shard_dir.glob("*.json")
+            if _USER_ID_RE.fullmatch(p.stem) and p.stem == p.stem.lower()
+        )
+
+    def add_visit(
+        self,
+        user_id: str,
+        county: str,
+        state: str,
+        date: str,
+        note: Optional[str] = None,
+    ) -> None:
+        """Add a visit to one user's shard and refresh its summary."""
+        user_id = self._check_user_id(user_id)
+        shard = self.store_for(user_id)
+        shard.add_visit(county=county, state=state, date=date, note=note)
+        self._write_summary(user_id, shard)
+
+    def list_visits(self, user_id: str) -> List[dict]:
+        """Return all visits for a single user."""
+        return self.store_for(user_id).list_visits()
+
+    def search(self, user_id: str, **filters) -> List[dict]:
+        """Search a single user's visits (see VisitStore.search)."""
+        return self.store_for(user_id).search(**filters)
+
+    def _write_summary(self, user_id: str, shard: VisitStore) -> dict:
+        """Recompute and save the per-state counts for a shard."""
+        by_state = shard.index().by_state
+        summary = {
+            "states": {
+                code: len(found) for code, found in sorted(by_state.items())
+                if found
+            },
+        }
+        summary["total"] = sum(summary["states"].values())
+
+        self.summary_dir.mkdir(parents=True, exist_ok=True)
+        path = self._summary_path(user_id)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(summary, indent=2) + "\n",
+                       encoding="utf-8")
+        tmp.replace(path)
+        return summary
+
+    def summary(self, user_id: str) -> dict:
+        """Return a user's summary, rebuilding it if missing or stale."""
+        user_id = self._check_user_id(user_id)
+        path = self._summary_path(user_id)
+        shard_path = self.shard_dir / f"{user_id}.json"
+
+        try:
+            fresh = path.stat().st_mtime_ns >= shard_path.stat().st_mtime_ns
+        except OSError:
+            fresh = False
+
+        if fresh:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(data, dict):
+                    return data
+            except Exception:
+                pass
+
+        if not shard_path.exists():
+            return {"states": {}, "total": 0}
+        return self._write_summary(user_id, VisitStore(shard_path))
+
+    def state_totals(self) -> Dict[str, int]:
+        """Return visit counts per state summed across every user."""
+        totals: Dict[str, int] = {}
+        for user_id in self.user_ids():
+            for code, n in self.summary(user_id).get("states", {}).items():
+                totals[code] = totals.get(code, 0) + n
+        return totals
+
+
+MERGE_POLICIES = ("earliest", "local", "remote")
+
+
+def _date_sort_key(date_str: str) -> Tuple[int, Date]:
+    """Sort real dates first (oldest to newest), unreadable ones last."""
+    try:
+        return (0, datetime.strptime(date_str, "%m/%d/%y").date())
+    except (TypeError, ValueError):
+        return (1, Date.max)
+
+
+def resolve_conflict(local: dict, remote: dict, policy: str) -> dict:
+    """Pick the merged record for a (county, state) found in both stores.
+
+    - earliest: keep the earlier date and join both notes.
+    - local / remote: keep that side's record as-is.
+    """
+    if policy == "local":
+        return local
+    if policy == "remote":
+        return remote
+
+    first, second = local, remote
+    if _date_sort_key(remote.get("date")) < _date_sort_key(local.get("date")):
+        first, second = remote, local
+
+    # Split notes that were joined by an earlier sync so syncing the
+    # same records again never repeats a note
+    notes = []
+    for note in (first.get("note"), second.get("note")):
+        if not isinstance(note, str):
+            continue
+        for part in note.split(" | "):
+            part = part.strip()
+            if part and part not in notes:
+                notes.append(part)
+
+    merged = dict(first)
+    merged["note"] = " | ".join(notes) if notes else None
+    return merged
+
+
+def _rows_by_state(
+    visits: List[dict], codes: Set[str]
+) -> Dict[str, Dict[Tuple[str, str], int]]:
+    """Map each wanted state to {(county, state): position in visits}."""
+    rows: Dict[str, Dict[Tuple[str, str], int]] = {c: {} for c in codes}
+    for pos, v in enumerate(visits):
+        if not isinstance(v, dict):
+            continue
+        found = rows.get(str(v.get("state", "")).upper())
+        if found is not None:
+            found[visit_key(v)] = pos
+    return rows
+
+
+def sync_stores(
+    local: VisitStore,
+    remote: VisitStore,
+    policy: str = "earliest",
+) -> dict:
+    """Merge two stores so both end up holding the same visits.
+
+    Only the saved per-state hashes are compared at first, so states
+    that already match are skipped without reading their rows. The
+    differing states are merged, and each file is written only if it
+    changed. Entries in either file that are not visit records are
+    kept as they are and are not copied across.
+
+    The remote file is read strictly: if it is missing or is not a
+    list of visits, ValueError is raised and nothing is written.
+    Returns a report of what was skipped, added and resolved.
+    """
+    if policy not in MERGE_POLICIES:
+        raise ValueError(
+            f"The merge policy: {policy!r} was not recognized. "
+            f"\nPlease use one of: {', '.join(MERGE_POLICIES)}.\n"
+        )
+
+    remote_hashes = remote.state_hashes(strict=True)
+    local_hashes = local.state_hashes()
+
+    report = {
+        "unchanged_states": [],
+        "merged_states": [],
+        "added_to_local": [],
+        "added_to_remote": [],
+        "conflicts": [],
+    }
+
+    differing = []
+    for code in sorted(set(local_hashes) | set(remote_hashes)):
+        if local_hashes.get(code) == remote_hashes.get(code):
+            report["unchanged_states"].append(code)
+        else:
+            differing.append(code)
+
+    if not differing:
+        return report
+
+    remote_visits = remote.load_strict()
+    local_visits = local.load()
+    local_by_state = _rows_by_state(local_visits, set(differing))
+    remote_by_state = _rows_by_state(remote_visits, set(differing))
+    local_changed = remote_changed = False
+
+    for code in differing:
+        report["merged_states"].append(code)
+        local_rows = local_by_state[code]
+        remote_rows = remote_by_state[code]
+
+        for key, pos in sorted(remote_rows.items()):
+            if key not in local_rows:
+                local_visits.append(remote_visits[pos])
+                report["added_to_local"].append(remote_visits[pos])
+                local_changed = True
+        for key, pos in sorted(local_rows.items()):
+            if key not in remote_rows:
+                remote_visits.append(local_visits[pos])
+                report["added_to_remote"].append(local_visits[pos])
+                remote_changed = True
+
+        for key in sorted(local_rows.keys() & remote_rows.keys()):
+            mine = local_visits[local_rows[key]]
+            theirs = remote_visits[remote_rows[key]]
+            if mine == theirs:
+                continue
+            merged = resolve_conflict(mine, theirs, policy)
+            report["conflicts"].append(
+                {"local": mine, "remote": theirs, "merged": merged}
+            )
+            if merged != mine:
+                local_visits[local_rows[key]] = merged
+                local_changed = True
+            if merged != theirs:
+                remote_visits[remote_rows[key]] = merged
+                remote_changed = True
+
+    # Only the merged states need new hashes
+    wanted = set(differing)
+    for target, visits, hashes, changed in (
+        (local, local_visits, local_hashes, local_changed),
+        (remote, remote_visits, remote_hashes, remote_changed),
+    ):
+        if changed:
+            target.save(visits)
+        hashes = {c: h for c, h in hashes.items() if c not in wanted}
+        hashes.update(state_hashes_for(
+            v for v in visits
+            if isinstance(v, dict)
+            and str(v.get("state", "")).upper() in wanted
+        ))
+        target.save_hashes(dict(sorted(hashes.items())))
+    return report
+
+
+# County boundaries are not shipped with the program. To draw maps,
+# download the Census cartographic boundary file for counties at 1:20m
+# (cb_2020_us_county_20m.zip, from the "Cartographic Boundary Files"
+# page at census.gov), convert it to GeoJSON, and save it next to
+# main.py as county_geometry.json, e.g.:
+#     ogr2ogr -f GeoJSON county_geometry.json cb_2020_us_county_20m.shp
+COUNTY_GEOMETRY_PATH = Path("county_geometry.json")
+
+# Simplification tolerance in degrees for each zoom level
+MAP_ZOOM_TOLERANCE: Dict[int, float] = {0: 0.02, 1: 0.002}
+MAP_USA_ZOOM = 0
+MAP_STATE_ZOOM = 1
+
+# Bump when the layout of the cached layers or the projection changes
+_MAP_CACHE_VERSION = 3
+_MAP_UNITS_PER_DEGREE = 100
+_MAP_LON_SCALE = math.cos(math.radians(38))  # centre of the lower 48
+_MAP_STYLE = (
+    "<style>path{fill:#e3e3e3;stroke:#ffffff;stroke-width:0.6;"
+    "vector-effect:non-scaling-stroke}path.v{fill:#2b7bba}</style>"
+)
+
+
+def _simplify_ring(points: List[List[float]], tolerance: float) -> list:
+    """Douglas-Peucker simplification of one closed ring of points."""
+    if len(points) < 4 or tolerance <= 0:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = points[first][:2], points[last][:2]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+
+        best, best_dist = None, tolerance
+        for i in range(first + 1, last):
+            px, py = points[i][:2]
+            if length == 0:
+                dist = math.hypot(px - x1, py - y1)
+            else:
+                dist = abs(dy * px - dx * py + x2 * y1 - y2 * x1) / length
+            if dist > best_dist:
+                best, best_dist = i, dist
+
+        if best is not None:
+            keep[best] = True
+            stack.append((first, best))
+            stack.append((best, last))
+
+    return [pt for pt, kept in zip(points, keep) if kept]
+
+
+def _project(lon: float, lat: float) -> Tuple[float, float]:
+    """Project lon/lat to map units (simple equirectangular)."""
+    if lon > 0:
+        lon -= 360  # keep the far Aleutians next to the rest of Alaska
+    return (lon * _MAP_LON_SCALE * _MAP_UNITS_PER_DEGREE,
+            -lat * _MAP_UNITS_PER_DEGREE)
+
+
+def _feature_info(properties: dict) -> Optional[Tuple[str, str, str, str]]:
+    """Return (id, state, full name, short name) for a county feature.
+
+    Works with Census cartographic boundary files: GEOID is the id,
+    NAMELSAD the full name ("Baltimore city", "Baltimore County") and
+    NAME the short one ("Baltimore"). The state comes from STUSPS or
+    STATE_NAME. Features outside the 50 states and DC are skipped.
+    """
+    name = properties.get("NAME")
+    full_name = properties.get("NAMELSAD") or name
+    state = properties.get("STUSPS") or properties.get("STATE_NAME")
+    if not all(isinstance(v, str) for v in (name, full_name, state)):
+        return None
+    try:
+        code = normalize_state_to_code(state)
+    except ValueError:
+        return None
+
+    geoid = properties.get("GEOID")
+    if not isinstance(geoid, str) or not geoid:
+        geoid = "|".join(visit_key({"county": full_name, "state": code}))
+    return geoid, code, full_name, name
+
+
+def _map_key(key: Tuple[str, str]) -> str:
+    """Turn a (county, state) key into a map alias key.
+
+    Accents are dropped so "Dona Ana" matches Census "Doña Ana".
+    """
+    county = unicodedata.normalize("NFKD", key[0])
+    county = "".join(c for c in county if not unicodedata.combining(c))
+    return f"{county.casefold()}|{key[1]}"
+
+
+def _county_aliases(counties: Dict[str, dict]) -> Dict[str, str]:
+    """Map the county names people log ("county|ST") to feature ids.
+
+    The full name always matches ("Baltimore City", "King County").
+    The short name matches too when it is unambiguous. Where a county
+    and an independent city share it, the short name means the county.
+    """
+    aliases: Dict[str, str] = {}
+    by_short: Dict[str, List[str]] = {}
+    for geoid, county in counties.items():
+        full = visit_key({"county": county["label"],
+                          "state": county["state"]})
+        aliases[_map_key(full)] = geoid
+        short = visit_key({"county": county["name"],
+                           "state": county["state"]})
+        by_short.setdefault(_map_key(short), []).append(geoid)
+
+    for key, ids in by_short.items():
+        if key in aliases:
+            continue
+        if len(ids) > 1:
+            ids = [i for i in ids
+                   if not counties[i]["label"].casefold().endswith(" city")]
+        if len(ids) == 1:
+            aliases[key] = ids[0]
+    return aliases
+
+
+class CountyMap:
+    """Render visited counties as an SVG map.
+
+    - Boundaries come from a GeoJSON file of US counties.
+    - Projected, simplified paths for each zoom level are cached on
+      disk next to the geometry file. A cache is rebuilt if the file,
+      the zoom tolerance or the projection changes.
+    - Logged county names are matched to boundaries by full Census
+      name first, so "Baltimore City" and "Baltimore" (the county)
+      stay apart.
+    - The last render for each map is kept, so drawing it again after a
+      new visit only restyles the counties whose status changed.
+    """
+
+    def __init__(self, geometry_path: Path, cache_dir: Optional[Path] = None):
+        self.geometry_path = Path(geometry_path)
+        self.cache_dir = (Path(cache_dir) if cache_dir is not None
+                          else self.geometry_path.parent)
+        self._layers: Dict[int, dict] = {}
+        self._rendered: Dict[Optional[str], dict] = {}
+
+    def _source_stamp(self, zoom: int) -> dict:
+        """Describe everything a cached layer depends on."""
+        st = self.geometry_path.stat()
+        return {
+            "file": [st.st_mtime_ns, st.st_size],
+            "tolerance": MAP_ZOOM_TOLERANCE[zoom],
+            "version": _MAP_CACHE_VERSION,
+            "projection": [_MAP_UNITS_PER_DEGREE, _MAP_LON_SCALE],
+        }
+
+    def _cache_path(self, zoom: int) -> Path:
+        return self.cache_dir / f"{self.geometry_path.stem}.z{zoom}.json"
+
+    def _build_layer(self, zoom: int) -> dict:
+        """Project and simplify every county for one zoom level."""
+        tolerance = MAP_ZOOM_TOLERANCE[zoom]
+        data = json.loads(self.geometry_path.read_text(encoding="utf-8"))
+
+        counties: Dict[str, dict] = {}
+        for feature in data.get("features", []):
+            info = _feature_info(feature.get("properties") or {})
+            geometry = feature.get("geometry") or {}
+            if info is None:
+                continue
+            if geometry.get("type") == "Polygon":
+                polygons = [geometry["coordinates"]]
+            elif geometry.get("type") == "MultiPolygon":
+                polygons = geometry["coordinates"]
+            else:
+                continue
+
+            rings = [ring for polygon in polygons for ring in polygon
+                     if len(ring) >= 4]
+            if not rings:
+                continue
+
+            # Rings that simplify away are dropped, but a county is never
+            # dropped: if nothing is left, its unsimplified rings are used
+            shapes = [_simplify_ring(ring, tolerance) for ring in rings]
+            shapes = [shape for shape in shapes if len(shape) >= 4]
+            if not shapes:
+                shapes = rings
+
+            parts = []
+            xs: List[float] = []
+            ys: List[float] = []
+            for shape in shapes:
+                projected = [_project(pt[0], pt[1]) for pt in shape]
+                xs.extend(x for x, _ in projected)
+                ys.extend(y for _, y in projected)
+                parts.append("M" + " ".join(
+                    f"{x:.1f},{y:.1f}" for x, y in projected[:-1]
+                ) + "Z")
+
+            geoid, code, full_name, name = info
+            box = [min(xs), min(ys), max(xs), max(ys)]
+            county = counties.get(geoid)
+            if county is None:
+                counties[geoid] = {
+                    "state": code, "label": full_name, "name": name,
+                    "path": "".join(parts), "bounds": box,
+                }
+            else:
+                old = county["bounds"]
+                county["path"] += "".join(parts)
+                county["bounds"] = [
+                    min(old[0], box[0]), min(old[1], box[1]),
+                    max(old[2], box[2]), max(old[3], box[3]),
+                ]
+
+        return {"source": self._source_stamp(zoom), "counties": counties,
+                "aliases": _county_aliases(counties)}
+
+    def layer(self, zoom: int) -> dict:
+        """Return the cached base layer for a zoom level."""
+        stamp = self._source_stamp(zoom)
+        layer = self._layers.get(zoom)
+        if layer is not None and layer["source"] == stamp:
+            return layer
+
+        cache = self._cache_path(zoom)
+        layer = None
+        try:
+            data = json.loads(cache.read_text(encoding="utf-8"))
+            if isinstance(data, dict) and data.get("source") == stamp:
+                layer = data
+        except Exception:
+            pass
+
+        if layer is None:
+            layer = self._build_layer(zoom)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_suffix(cache.suffix + ".tmp")
+            tmp.write_text(json.dumps(layer, separators=(",", ":")),
+                           encoding="utf-8")
+            tmp.replace(cache)
+
+        self._layers[zoom] = layer
+        # Drop earlier renders that were drawn from the old layer
+        for scope in list(self._rendered):
+            if (scope is None) == (zoom == MAP_USA_ZOOM):
+                del self._rendered[scope]
+        return layer
+
+    @staticmethod
+    def _path_element(county: dict, visited: bool) -> str:
+        title = escape(f"{county['label']}, {county['state']}")
+        css = ' class="v"' if visited else ""
+        return f'<path{css} d="{county["path"]}"><title>{title}</title></path>'
+
+    def _start_render(self, state: Optional[str]) -> dict:
+        """Lay out the static parts of a map: viewBox and county order."""
+        layer = self.layer(MAP_STATE_ZOOM if state else MAP_USA_ZOOM)
+        counties = layer["counties"]
+        ids = sorted(i for i, c in counties.items()
+                     if state is None or c["state"] == state)
+        if not ids:
+            raise ValueError(
+                f"No county boundaries were found for {state or 'the USA'}."
+            )
+
+        boxes = [counties[i]["bounds"] for i in ids]
+        x0 = min(b[0] for b in boxes)
+        y0 = min(b[1] for b in boxes)
+        x1 = max(b[2] for b in boxes)
+        y1 = max(b[3] for b in boxes)
+        pad = max(x1 - x0, y1 - y0) * 0.02
+        header = (
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="{x0 - pad:.1f} {y0 - pad:.1f} '
+            f'{x1 - x0 + 2 * pad:.1f} {y1 - y0 + 2 * pad:.1f}">'
+            + _MAP_STYLE + "<g>"
+        )
+        return {
+            "header": header,
+            "positions": {geoid: i for i, geoid in enumerate(ids)},
+            "elements": [self._path_element(counties[i], False)
+                         for i in ids],
+            "visited": set(),
+            "counties": counties,
+            "aliases": layer["aliases"],
+        }
+
+    def render(
+        self,
+        visited: Iterable[Tuple[str, str]],
+        state: Optional[str] = None,
+    ) -> str:
+        """Return an SVG map with the visited (county, state) keys filled.
+
+        Pass a state (code or name) for a single-state map, otherwise the
+        whole USA is drawn.
+        """
+        code = normalize_state_to_code(state) if state else None
+        self.layer(MAP_STATE_ZOOM if code else MAP_USA_ZOOM)
+
+        rendered = self._rendered.get(code)
+        if rendered is None:
+            rendered = self._rendered[code] = self._start_render(code)
+
+        aliases = rendered["aliases"]
+        wanted = {aliases.get(_map_key(k)) for k in visited}
+        wanted &= rendered["positions"].keys()
+        for geoid in wanted ^ rendered["visited"]:
+            rendered["elements"][rendered["positions"][geoid]] = (
+                self._path_element(rendered["counties"][geoid],
+                                   geoid in wanted)
+            )
+        rendered["visited"] = wanted
+
+        return (rendered["header"] + "".join(rendered["elements"])
+                + "</g></svg>\n")
+
+    def unmatched(
+        self,
+        visited: Iterable[Tuple[str, str]],
+        state: Optional[str] = None,
+    ) -> List[Tuple[str, str]]:
+        """Return the visited (county, state) keys that match no county
+        boundary, limited to one state if given. These are left blank
+        on the map, usually because of a typo in the logged name."""
+        code = normalize_state_to_code(state) if state else None
+        layer = self.layer(MAP_STATE_ZOOM if code else MAP_USA_ZOOM)
+        aliases = layer["aliases"]
+        return sorted(k for k in visited
+                      if (code is None or k[1] == code)
+                      and _map_key(k) not in aliases)
+
+    def render_store(
+        self, visit_store: VisitStore, state: Optional[str] = None
+    ) -> str:
+        """Render the map for the visits saved in a VisitStore."""
+        return self.render(visit_store.index().keys, state=state)
+
 
 def validate_date(input):
     """This function takes a string as input and validates whether it
@@ -231,19 +1276,22 @@ def main_menu():
         print("-------------------------------------")
         print("\n1. Log a Visit")
         print("2. View Statistics")
-        print("3. Exit")
-        print("\nHere you can choose to record a new visit to a county or")
-        print("view statistics about all of the visits that have been made.")
-        print("If you are done using this tool, you can input 3 to exit")
-        print("the program.")
+        print("3. Search Visits")
+        print("4. Sync With Another Device")
+        print("5. Exit")
+        print("\nHere you can choose to record a new visit to a county,")
+        print("view statistics about all of the visits that have been made,")
+        print("search your visits, or combine your visits with a file from")
+        print("another device. If you are done using this tool, you can")
+        print("input 5 to exit the program.")
 
         menu_choice = input("\nPlease enter your selection: ")
 
-        if menu_choice == "1" or menu_choice == "2" or menu_choice == "3":
+        if menu_choice in ("1", "2", "3", "4", "5"):
             return menu_choice
 
         print("\nYou have entered an invalid choice.")
-        print("Please enter 1-3 as your input.\n")
+        print("Please enter 1-5 as your input.\n")
 
 
 def log_visit():
@@ -319,9 +1367,7 @@ def log_visit():
 def count_visited_by_state(usps_code: str) -> int:
     """Return the number of unique (county, state)
     visits stored for the state."""
-    visits = store.list_visits()
-    code = usps_code.upper()
-    return sum(1 for v in visits if str(v.get("state", "")).upper() == code)
+    return len(store.index().by_state.get(usps_code.upper(), ()))
 
 
 def percent(n: int, d: int) -> int:
@@ -374,10 +1420,9 @@ def _show_usa_statistics():
     print("-------------------------------------")
     print("\nYou have selected to look up statistics for the entire USA.\n")
 
-    visits = store.list_visits()
+    by_state = store.index().by_state
     visited_usa = sum(
-        1 for v in visits
-        if str(v.get("state", "")).upper() in STATE_TOTALS
+        len(by_state.get(code, ())) for code in STATE_TOTALS
     )
     total_usa = USA_TOTAL
     pct = percent(visited_usa, total_usa)
@@ -390,6 +1435,56 @@ def _show_usa_statistics():
     press_any_key()
 
 
+def save_visit_map():
+    """This function saves an SVG map with the visited counties filled
+    in, either for one state or for the whole USA."""
+
+    print("\n-------------------------------------")
+    print(" County Tracker View Statistics Menu")
+    print("-------------------------------------")
+    print("\nYou have selected to save a map of your visits. Enter a state")
+    print("for a map of just that state, or press the enter key for a map")
+    print("of the entire USA.\n")
+
+    if not county_map.geometry_path.is_file():
+        print(f"The county boundary file {str(COUNTY_GEOMETRY_PATH)!r}")
+        print("was not found, so a map cannot be drawn. Download the")
+        print("Census 1:20m county cartographic boundary file")
+        print("(cb_2020_us_county_20m), convert it to GeoJSON and save it")
+        print(f"as {str(COUNTY_GEOMETRY_PATH)!r} next to this program.")
+        press_any_key()
+        return
+
+    while True:
+        user_state = input("Please input your state: ").strip() or None
+        if user_state is None:
+            break
+        try:
+            user_state = normalize_state_to_code(user_state)
+            break
+        except ValueError as exc:
+            print(f"\n{exc}")
+
+    try:
+        svg = county_map.render_store(store, state=user_state)
+    except ValueError as exc:
+        print(f"\nThe map was not saved because:\n{exc}")
+        press_any_key()
+        return
+
+    out_path = Path(f"county_map_{user_state or 'USA'}.svg")
+    out_path.write_text(svg, encoding="utf-8")
+    print(f"\nYour map was saved to {out_path}.")
+
+    missing = county_map.unmatched(store.index().keys, state=user_state)
+    if missing:
+        print("\nThese visits did not match a county on the map, so they")
+        print("are not shown. Check the spelling of the county name:")
+        for county, state in missing:
+            print(f"  {county.title()}, {state}")
+    press_any_key()
+
+
 def view_statistics_menu():
     """Interactive statistics menu loop (state, USA, return)."""
 
@@ -405,7 +1500,8 @@ def view_statistics_menu():
         print("-------------------------------------")
         print("1. Display Statistics for a state")
         print("2. Display Statistics for the USA")
-        print("3. Return to Main Menu\n")
+        print("3. Save a Map of Your Visits")
+        print("4. Return to Main Menu\n")
 
         selection = input("Please enter your selection: ").strip()
         if selection == "1":
@@ -413,14 +1509,121 @@ def view_statistics_menu():
         elif selection == "2":
             _show_usa_statistics()
         elif selection == "3":
+            save_visit_map()
+        elif selection == "4":
             return
         else:
             print("\nYou have entered an invalid choice.")
-            print("Please enter 1-3 as your input.\n")
+            print("Please enter 1-4 as your input.\n")
+
+
+def _prompt_optional_date(prompt: str) -> Optional[str]:
+    """Ask for an optional MM/DD/YY date, re-asking until it is valid."""
+    while True:
+        value = input(prompt).strip()
+        if not value:
+            return None
+        if validate_date(value):
+            return value
+        print("\nYou have input an invalid date or did not use the "
+              "MM/DD/YY format.\n")
+
+
+def search_visits():
+    """This function asks the user for search filters and prints the
+    visits that match all of them. Every filter is optional."""
+
+    print("\n-------------------------------------")
+    print("     County Tracker Search Visits")
+    print("-------------------------------------")
+    print("\nYou can search your visits by state, the start of a county")
+    print("name, a range of dates, or words in the note. Press the enter")
+    print("key to skip any filter you don't want to use.\n")
+
+    while True:
+        state = input("State: ").strip() or None
+        if state is None:
+            break
+        try:
+            normalize_state_to_code(state)
+            break
+        except ValueError as exc:
+            print(f"\n{exc}")
+
+    county_prefix = input("County name starts with: ").strip() or None
+    date_from = _prompt_optional_date("Visited on or after (MM/DD/YY): ")
+    date_to = _prompt_optional_date("Visited on or before (MM/DD/YY): ")
+    text = input("Words in the note: ").strip() or None
+
+    results = store.search(
+        state=state,
+        county_prefix=county_prefix,
+        date_from=date_from,
+        date_to=date_to,
+        text=text,
+    )
+
+    if not results:
+        print("\nNo visits matched your search.")
+    else:
+        print(f"\n{len(results)} visit(s) matched your search:\n")
+        for v in results:
+            line = f"{v.get('county', '')}, {v.get('state', '')} " \
+                   f"on {v.get('date', '')}"
+            if v.get("note"):
+                line += f" - {v['note']}"
+            print(line)
+
+    input("\nPress Enter to return to the Main Menu...")
+
+
+def sync_with_device():
+    """This function asks for the visits file from another device,
+    merges it with this one so both files match, and prints what
+    changed."""
+
+    print("\n-------------------------------------")
+    print("  County Tracker Sync With a Device")
+    print("-------------------------------------")
+    print("\nHere you can combine your visits with a county_visits.json")
+    print("file copied from another device. Both files will hold every")
+    print("visit when we are done. If the same county was logged on both")
+    print("devices, the earlier date is kept and the notes are combined.\n")
+
+    other_path = Path(input("Path to the other file: ").strip())
+    if not other_path.is_file():
+        print(f"\nThe file {str(other_path)!r} was not found.")
+        input("\nPress Enter to return to the Main Menu...")
+        return
+
+    try:
+        report = sync_stores(store, VisitStore(other_path))
+    except ValueError as exc:
+        print(f"\nNothing was synced because:\n{exc}")
+        input("\nPress Enter to return to the Main Menu...")
+        return
+    except OSError as exc:
+        print(f"\nThe sync could not finish because a file could not be "
+              f"saved:\n{exc}\n")
+        input("\nPress Enter to return to the Main Menu...")
+        return
+
+    print(f"\n{len(report['unchanged_states'])} state(s) already matched.")
+    print(f"{len(report['merged_states'])} state(s) were merged.")
+    print(f"{len(report['added_to_local'])} visit(s) were added here.")
+    print(f"{len(report['added_to_remote'])} visit(s) were added to "
+          "the other file.")
+    for conflict in report["conflicts"]:
+        merged = conflict["merged"]
+        print(f"Combined {merged.get('county', '')}, "
+              f"{merged.get('state', '')}: kept {merged.get('date', '')}")
+
+    input("\nPress Enter to return to the Main Menu...")
 
 
 store = VisitStore(Path("county_visits.json"))
 store.ensure_file()
+county_map = CountyMap(COUNTY_GEOMETRY_PATH)
 
 
 def main():
@@ -440,6 +1643,10 @@ def main():
             log_visit()
         elif choice == "2":
             view_statistics_menu()
+        elif choice == "3":
+            search_visits()
+        elif choice == "4":
+            sync_with_device()
         else:
             print("\nThank you for exploring the County Tracker.")
             print("Please come again when you have more time!")